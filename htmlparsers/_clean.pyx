@@ -0,0 +1,72 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Compiled string cleaning used by the HTML parsers.
+
+This module is optional. If it isn't built, google_search falls back to the pure
+Python implementation, which produces the same output.
+"""
+
+from libc.stdlib cimport free, malloc
+
+
+cdef extern from "Python.h":
+    int PyUnicode_KIND(object o)
+    void* PyUnicode_DATA(object o)
+    Py_ssize_t PyUnicode_GET_LENGTH(object o)
+    Py_UCS4 PyUnicode_READ(int kind, void* data, Py_ssize_t index)
+    void PyUnicode_WRITE(int kind, void* data, Py_ssize_t index, Py_UCS4 value)
+    bint Py_UNICODE_ISSPACE(Py_UCS4 ch)
+    object PyUnicode_FromKindAndData(int kind, const void* buffer, Py_ssize_t size)
+
+
+cpdef str clean(object content):
+    """Strip a string and collapse every run of inner whitespace to one space.
+
+    Equivalent to ' '.join(content.split()), but done in a single pass over the
+    string without building the intermediate list of words.
+
+    Args:
+        content: The string to clean. Subclasses of str, i.e. the smart strings
+                 returned by lxml, are accepted as well.
+
+    Returns:
+        The cleaned string.
+    """
+    cdef Py_ssize_t length
+    cdef int kind
+    cdef void* data
+    cdef void* out
+    cdef Py_ssize_t i
+    cdef Py_ssize_t j = 0
+    cdef bint pending_space = False
+    cdef Py_UCS4 ch
+
+    if not isinstance(content, str):
+        raise TypeError(f'expected str, got {type(content).__name__}')
+
+    length = PyUnicode_GET_LENGTH(content)
+    kind = PyUnicode_KIND(content)
+    data = PyUnicode_DATA(content)
+    if length == 0:
+        return ''
+
+    out = malloc(length * kind)
+    if out == NULL:
+        raise MemoryError()
+
+    try:
+        for i in range(length):
+            ch = PyUnicode_READ(kind, data, i)
+            if Py_UNICODE_ISSPACE(ch):
+                # Only emit the space once the next word starts, which also drops
+                # trailing whitespace. j == 0 drops leading whitespace.
+                pending_space = j > 0
+            else:
+                if pending_space:
+                    PyUnicode_WRITE(kind, out, j, ' ')
+                    j += 1
+                    pending_space = False
+                PyUnicode_WRITE(kind, out, j, ch)
+                j += 1
+        return PyUnicode_FromKindAndData(kind, out, j)
+    finally:
+        free(out)
@@ -0,0 +1,396 @@
+/*
+ * SIMD whitespace collapsing for the HTML parsers.
+ *
+ * clean() strips a string and collapses every run of inner whitespace to a single
+ * space, the same as ' '.join(content.split()). Blocks of 32 bytes (AVX2) or 16
+ * bytes (SSE2) are classified at once: blocks without whitespace are copied as is,
+ * blocks made only of whitespace are skipped, and only mixed blocks are handled
+ * character by character.
+ *
+ * Strings stored with one byte per character (Latin-1, which includes ASCII) and
+ * with two bytes per character (the rest of the Basic Multilingual Plane, i.e. text
+ * with dashes or curly quotes) are handled. For strings with characters beyond the
+ * BMP clean() returns None and the caller falls back to the generic implementation.
+ * This module is optional, google_search works without it.
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <string.h>
+
+#if (defined(__x86_64__) || defined(__i386__)) && defined(__GNUC__)
+#define CLEAN_X86 1
+#include <immintrin.h>
+#endif
+
+/* Whitespace as defined by str.isspace() for characters below 256. */
+static int
+is_space(unsigned char ch)
+{
+    return (ch >= 0x09 && ch <= 0x0d) || (ch >= 0x1c && ch <= 0x20) ||
+           ch == 0x85 || ch == 0xa0;
+}
+
+/* Whitespace as defined by str.isspace() for characters of the BMP. */
+static int
+is_space_ucs2(Py_UCS2 ch)
+{
+    if (ch < 256) {
+        return is_space((unsigned char)ch);
+    }
+    return ch == 0x1680 || (ch >= 0x2000 && ch <= 0x200a) || ch == 0x2028 ||
+           ch == 0x2029 || ch == 0x202f || ch == 0x205f || ch == 0x3000;
+}
+
+/* Same as clean_scalar() for strings with two bytes per character. */
+static void
+clean_scalar_ucs2(const Py_UCS2 *src, Py_ssize_t start, Py_ssize_t length,
+                  Py_UCS2 *out, Py_ssize_t *j, int *pending)
+{
+    Py_ssize_t i;
+
+    for (i = start; i < length; i++) {
+        Py_UCS2 ch = src[i];
+        if (is_space_ucs2(ch)) {
+            *pending = *j > 0;
+        }
+        else {
+            if (*pending) {
+                out[(*j)++] = ' ';
+                *pending = 0;
+            }
+            out[(*j)++] = ch;
+        }
+    }
+}
+
+/*
+ * Clean src[start:length] into out starting at *j. *pending tells whether a space
+ * has to be written before the next non-whitespace character.
+ */
+static void
+clean_scalar(const unsigned char *src, Py_ssize_t start, Py_ssize_t length,
+             unsigned char *out, Py_ssize_t *j, int *pending)
+{
+    Py_ssize_t i;
+
+    for (i = start; i < length; i++) {
+        unsigned char ch = src[i];
+        if (is_space(ch)) {
+            /* Dropping the space while nothing was written strips the start. */
+            *pending = *j > 0;
+        }
+        else {
+            if (*pending) {
+                out[(*j)++] = ' ';
+                *pending = 0;
+            }
+            out[(*j)++] = ch;
+        }
+    }
+}
+
+#ifdef CLEAN_X86
+
+/* Returns the number of characters processed, always a multiple of 32. */
+__attribute__((target("avx2")))
+static Py_ssize_t
+clean_avx2(const unsigned char *src, Py_ssize_t length, unsigned char *out,
+           Py_ssize_t *j, int *pending)
+{
+    const __m256i low_start = _mm256_set1_epi8(0x09);
+    const __m256i high_start = _mm256_set1_epi8(0x1c);
+    const __m256i range = _mm256_set1_epi8(4);
+    const __m256i nel = _mm256_set1_epi8((char)0x85);
+    const __m256i nbsp = _mm256_set1_epi8((char)0xa0);
+    Py_ssize_t i = 0;
+
+    for (; i + 32 <= length; i += 32) {
+        __m256i block = _mm256_loadu_si256((const __m256i *)(src + i));
+        /* x - start <= 4 as unsigned bytes, i.e. min(x - start, 4) == x - start. */
+        __m256i low = _mm256_sub_epi8(block, low_start);
+        __m256i high = _mm256_sub_epi8(block, high_start);
+        __m256i space = _mm256_or_si256(
+            _mm256_or_si256(_mm256_cmpeq_epi8(_mm256_min_epu8(low, range), low),
+                            _mm256_cmpeq_epi8(_mm256_min_epu8(high, range), high)),
+            _mm256_or_si256(_mm256_cmpeq_epi8(block, nel),
+                            _mm256_cmpeq_epi8(block, nbsp)));
+        unsigned int mask = (unsigned int)_mm256_movemask_epi8(space);
+
+        if (mask == 0) {
+            if (*pending) {
+                out[(*j)++] = ' ';
+                *pending = 0;
+            }
+            _mm256_storeu_si256((__m256i *)(out + *j), block);
+            *j += 32;
+        }
+        else if (mask == 0xffffffffu) {
+            *pending = *j > 0;
+        }
+        else {
+            clean_scalar(src, i, i + 32, out, j, pending);
+        }
+    }
+    return i;
+}
+
+/*
+ * Same as clean_avx2() for strings with two bytes per character, 16 characters at a
+ * time. Characters from U+1680 up may be whitespace, blocks containing any of them
+ * are handled character by character.
+ */
+__attribute__((target("avx2")))
+static Py_ssize_t
+clean_avx2_ucs2(const Py_UCS2 *src, Py_ssize_t length, Py_UCS2 *out,
+                Py_ssize_t *j, int *pending)
+{
+    const __m256i zero = _mm256_setzero_si256();
+    const __m256i low_start = _mm256_set1_epi16(0x09);
+    const __m256i high_start = _mm256_set1_epi16(0x1c);
+    const __m256i range = _mm256_set1_epi16(4);
+    const __m256i nel = _mm256_set1_epi16(0x85);
+    const __m256i nbsp = _mm256_set1_epi16(0xa0);
+    const __m256i below_wide = _mm256_set1_epi16(0x167f);
+    Py_ssize_t i = 0;
+
+    for (; i + 16 <= length; i += 16) {
+        __m256i block = _mm256_loadu_si256((const __m256i *)(src + i));
+        /* x - start <= 4 as unsigned, i.e. the saturated x - start - 4 is 0. */
+        __m256i low = _mm256_subs_epu16(_mm256_sub_epi16(block, low_start), range);
+        __m256i high = _mm256_subs_epu16(_mm256_sub_epi16(block, high_start), range);
+        __m256i space = _mm256_or_si256(
+            _mm256_or_si256(_mm256_cmpeq_epi16(low, zero), _mm256_cmpeq_epi16(high, zero)),
+            _mm256_or_si256(_mm256_cmpeq_epi16(block, nel),
+                            _mm256_cmpeq_epi16(block, nbsp)));
+        /* All characters below U+1680, so space holds every whitespace character. */
+        __m256i narrow = _mm256_cmpeq_epi16(_mm256_subs_epu16(block, below_wide), zero);
+        unsigned int mask = (unsigned int)_mm256_movemask_epi8(space);
+        unsigned int narrow_mask = (unsigned int)_mm256_movemask_epi8(narrow);
+
+        if (mask == 0 && narrow_mask == 0xffffffffu) {
+            if (*pending) {
+                out[(*j)++] = ' ';
+                *pending = 0;
+            }
+            _mm256_storeu_si256((__m256i *)(out + *j), block);
+            *j += 16;
+        }
+        else if (mask == 0xffffffffu) {
+            *pending = *j > 0;
+        }
+        else {
+            clean_scalar_ucs2(src, i, i + 16, out, j, pending);
+        }
+    }
+    return i;
+}
+
+#endif
+
+#if defined(CLEAN_X86) && defined(__SSE2__)
+
+/* Returns the number of characters processed, always a multiple of 16. */
+static Py_ssize_t
+clean_sse2(const unsigned char *src, Py_ssize_t length, unsigned char *out,
+           Py_ssize_t *j, int *pending)
+{
+    const __m128i low_start = _mm_set1_epi8(0x09);
+    const __m128i high_start = _mm_set1_epi8(0x1c);
+    const __m128i range = _mm_set1_epi8(4);
+    const __m128i nel = _mm_set1_epi8((char)0x85);
+    const __m128i nbsp = _mm_set1_epi8((char)0xa0);
+    Py_ssize_t i = 0;
+
+    for (; i + 16 <= length; i += 16) {
+        __m128i block = _mm_loadu_si128((const __m128i *)(src + i));
+        __m128i low = _mm_sub_epi8(block, low_start);
+        __m128i high = _mm_sub_epi8(block, high_start);
+        __m128i space = _mm_or_si128(
+            _mm_or_si128(_mm_cmpeq_epi8(_mm_min_epu8(low, range), low),
+                         _mm_cmpeq_epi8(_mm_min_epu8(high, range), high)),
+            _mm_or_si128(_mm_cmpeq_epi8(block, nel), _mm_cmpeq_epi8(block, nbsp)));
+        int mask = _mm_movemask_epi8(space);
+
+        if (mask == 0) {
+            if (*pending) {
+                out[(*j)++] = ' ';
+                *pending = 0;
+            }
+            _mm_storeu_si128((__m128i *)(out + *j), block);
+            *j += 16;
+        }
+        else if (mask == 0xffff) {
+            *pending = *j > 0;
+        }
+        else {
+            clean_scalar(src, i, i + 16, out, j, pending);
+        }
+    }
+    return i;
+}
+
+/* Same as clean_avx2_ucs2() with SSE2, 8 characters at a time. */
+static Py_ssize_t
+clean_sse2_ucs2(const Py_UCS2 *src, Py_ssize_t length, Py_UCS2 *out,
+                Py_ssize_t *j, int *pending)
+{
+    const __m128i zero = _mm_setzero_si128();
+    const __m128i low_start = _mm_set1_epi16(0x09);
+    const __m128i high_start = _mm_set1_epi16(0x1c);
+    const __m128i range = _mm_set1_epi16(4);
+    const __m128i nel = _mm_set1_epi16(0x85);
+    const __m128i nbsp = _mm_set1_epi16(0xa0);
+    const __m128i below_wide = _mm_set1_epi16(0x167f);
+    Py_ssize_t i = 0;
+
+    for (; i + 8 <= length; i += 8) {
+        __m128i block = _mm_loadu_si128((const __m128i *)(src + i));
+        __m128i low = _mm_subs_epu16(_mm_sub_epi16(block, low_start), range);
+        __m128i high = _mm_subs_epu16(_mm_sub_epi16(block, high_start), range);
+        __m128i space = _mm_or_si128(
+            _mm_or_si128(_mm_cmpeq_epi16(low, zero), _mm_cmpeq_epi16(high, zero)),
+            _mm_or_si128(_mm_cmpeq_epi16(block, nel), _mm_cmpeq_epi16(block, nbsp)));
+        __m128i narrow = _mm_cmpeq_epi16(_mm_subs_epu16(block, below_wide), zero);
+        int mask = _mm_movemask_epi8(space);
+        int narrow_mask = _mm_movemask_epi8(narrow);
+
+        if (mask == 0 && narrow_mask == 0xffff) {
+            if (*pending) {
+                out[(*j)++] = ' ';
+                *pending = 0;
+            }
+            _mm_storeu_si128((__m128i *)(out + *j), block);
+            *j += 8;
+        }
+        else if (mask == 0xffff) {
+            *pending = *j > 0;
+        }
+        else {
+            clean_scalar_ucs2(src, i, i + 8, out, j, pending);
+        }
+    }
+    return i;
+}
+
+#endif
+
+static int has_avx2 = 0;
+
+/* Clean a string with two bytes per character. */
+static PyObject *
+clean_ucs2(PyObject *content)
+{
+    const Py_UCS2 *src = PyUnicode_2BYTE_DATA(content);
+    Py_ssize_t length = PyUnicode_GET_LENGTH(content);
+    Py_UCS2 *out;
+    Py_ssize_t i = 0;
+    Py_ssize_t j = 0;
+    int pending = 0;
+    PyObject *result;
+
+    out = PyMem_Malloc((length + 1) * sizeof(Py_UCS2));
+    if (out == NULL) {
+        return PyErr_NoMemory();
+    }
+
+#ifdef CLEAN_X86
+    if (has_avx2) {
+        i = clean_avx2_ucs2(src, length, out, &j, &pending);
+    }
+#endif
+#if defined(CLEAN_X86) && defined(__SSE2__)
+    if (!has_avx2) {
+        i = clean_sse2_ucs2(src, length, out, &j, &pending);
+    }
+#endif
+    clean_scalar_ucs2(src, i, length, out, &j, &pending);
+
+    /* Narrows the result to one byte per character if the cleaned text allows it. */
+    result = PyUnicode_FromKindAndData(PyUnicode_2BYTE_KIND, out, j);
+    PyMem_Free(out);
+    return result;
+}
+
+static PyObject *
+clean(PyObject *module, PyObject *content)
+{
+    const unsigned char *src;
+    unsigned char *out;
+    Py_ssize_t length;
+    Py_ssize_t i = 0;
+    Py_ssize_t j = 0;
+    int pending = 0;
+    PyObject *result;
+
+    if (!PyUnicode_Check(content)) {
+        PyErr_Format(PyExc_TypeError, "expected str, got %.200s",
+                     Py_TYPE(content)->tp_name);
+        return NULL;
+    }
+#if PY_VERSION_HEX < 0x030C0000
+    if (PyUnicode_READY(content) < 0) {
+        return NULL;
+    }
+#endif
+    if (PyUnicode_KIND(content) == PyUnicode_2BYTE_KIND) {
+        return clean_ucs2(content);
+    }
+    if (PyUnicode_KIND(content) != PyUnicode_1BYTE_KIND) {
+        Py_RETURN_NONE;
+    }
+
+    src = PyUnicode_1BYTE_DATA(content);
+    length = PyUnicode_GET_LENGTH(content);
+    if (length == 0) {
+        return PyUnicode_New(0, 0);
+    }
+
+    /* A block copy writes at most one pending space plus the block itself. */
+    out = PyMem_Malloc(length + 1);
+    if (out == NULL) {
+        return PyErr_NoMemory();
+    }
+
+#ifdef CLEAN_X86
+    if (has_avx2) {
+        i = clean_avx2(src, length, out, &j, &pending);
+    }
+#endif
+#if defined(CLEAN_X86) && defined(__SSE2__)
+    if (!has_avx2) {
+        i = clean_sse2(src, length, out, &j, &pending);
+    }
+#endif
+    clean_scalar(src, i, length, out, &j, &pending);
+
+    /* Computes the smallest fitting representation, i.e. ASCII when possible. */
+    result = PyUnicode_FromKindAndData(PyUnicode_1BYTE_KIND, out, j);
+    PyMem_Free(out);
+    return result;
+}
+
+static PyMethodDef clean_simd_methods[] = {
+    {"clean", clean, METH_O,
+     "clean(content)\n--\n\n"
+     "Strip a string and collapse every run of inner whitespace to one space.\n\n"
+     "Returns None if the string has characters beyond the Basic Multilingual Plane."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef clean_simd_module = {
+    PyModuleDef_HEAD_INIT,
+    "_clean_simd",
+    "SIMD whitespace collapsing for the HTML parsers.",
+    -1,
+    clean_simd_methods
+};
+
+PyMODINIT_FUNC
+PyInit__clean_simd(void)
+{
+#ifdef CLEAN_X86
+    __builtin_cpu_init();
+    has_avx2 = __builtin_cpu_supports("avx2");
+#endif
+    return PyModule_Create(&clean_simd_module);
+}
@@ -0,0 +1,25 @@
+# cython: language_level=3
+"""Access to the libxml2 document behind lxml elements.
+
+Used to index the document order of parsed trees. The document is read through
+lxml's public C API, so this doesn't depend on the memory layout of lxml's objects.
+
+This module is optional. If it isn't built, google_search doesn't index the document
+order, which only makes XPath queries on large documents a little slower.
+"""
+
+from lxml.includes.etreepublic cimport _Element, import_lxml__etree
+
+import_lxml__etree()
+
+
+def doc_address(_Element element):
+    """Get the address of the libxml2 xmlDoc an element belongs to.
+
+    Args:
+        element: Any element of a parsed document.
+
+    Returns:
+        The address of the xmlDoc as an integer.
+    """
+    return <size_t>element._doc._c_doc
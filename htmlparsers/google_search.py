@@ -1,4 +1,144 @@
-from lxml import html
+import ctypes
+import functools
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+from lxml import etree, html
+
+try:
+    from htmlparsers._clean import clean as _clean_unicode
+except ImportError:
+    def _clean_unicode(content):
+        # str.split() drops leading and trailing whitespace as well, so a single
+        # split/join both strips the string and collapses inner whitespace runs.
+        return ' '.join(content.split())
+
+try:
+    from htmlparsers._clean_simd import clean as _clean_bmp
+except ImportError:
+    _clean_str = _clean_unicode
+else:
+    def _clean_str(content):
+        # The SIMD version handles strings within the Basic Multilingual Plane, which
+        # covers SERP text with dashes and curly quotes, and returns None otherwise.
+        cleaned = _clean_bmp(content)
+        return _clean_unicode(content) if cleaned is None else cleaned
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+
+try:
+    from htmlparsers._docorder import doc_address as _doc_address
+except ImportError:
+    _doc_address = None
+
+
+@functools.lru_cache(maxsize=None)
+def _get_order_doc_elems():
+    """Look up libxml2's xmlXPathOrderDocElems() on first use.
+
+    lxml exports the symbols of the libxml2 it is linked against, whether statically
+    or dynamically, so the function is looked up through lxml itself.
+
+    Returns:
+        The function as a ctypes function, or None if it isn't available.
+    """
+    if _doc_address is None:
+        return None
+    try:
+        order_doc_elems = ctypes.CDLL(etree.__file__).xmlXPathOrderDocElems
+    except (OSError, AttributeError):
+        return None
+    order_doc_elems.argtypes = [ctypes.c_void_p]
+    order_doc_elems.restype = ctypes.c_long
+    return order_doc_elems
+
+
+def _order_doc_elems(element) -> None:
+    """Index the document order of all elements in the element's document.
+
+    libxml2 sorts every XPath node-set in document order. Once the elements are
+    indexed with xmlXPathOrderDocElems() that sort compares precomputed positions
+    instead of walking the tree. This is a best effort optimization and silently
+    does nothing if the _docorder extension isn't built or libxml2 can't be reached.
+
+    libxml2 only supports the index on static documents: once an indexed tree is
+    modified, XPath returns nodes in the wrong order. Only index trees that are
+    never handed out to callers.
+
+    Args:
+        element: Any element of the parsed document.
+    """
+    order_doc_elems = _get_order_doc_elems()
+    if order_doc_elems is not None:
+        order_doc_elems(_doc_address(element))
+
+
+def _parse_html_indexed(html_str):
+    """Parse HTML with lxml and index the document order of its elements.
+
+    The returned tree must not be modified or exposed, see _order_doc_elems().
+
+    Args:
+        html_str: The HTML source as a string.
+
+    Returns:
+        The root element of the parsed document.
+    """
+    tree = html.fromstring(html_str)
+    _order_doc_elems(tree)
+    return tree
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_html_cached(html_str):
+    """Parse HTML with lxml, reusing the tree if the same HTML was parsed recently.
+
+    The cache is keyed on the HTML string itself. Python caches the hash of a string
+    object, so repeated lookups with the same object don't rehash the document. The
+    cache is kept small since a parsed SERP takes several times the memory of its HTML.
+
+    Args:
+        html_str: The HTML source as a string.
+
+    Returns:
+        The root element of the parsed document, shared between callers.
+    """
+    return html.fromstring(html_str)
+
+
+def _lexbor_first_text(node):
+    """Get the first text node child of a selectolax node.
+
+    This matches what the XPath expression text()[1] selects.
+
+    Args:
+        node: A selectolax node.
+
+    Returns:
+        The text of the first text node child or None if the node has none.
+    """
+    for child in node.iter(include_text=True):
+        if child.tag == '-text':
+            return child.text_content
+    return None
+
+
+class OrganicResult(NamedTuple):
+    """A single organic Google Search result.
+
+    Tuples take less memory and are faster to create than dicts, which adds up on
+    SERPs with 100 results. Use _asdict() to get the result as a dict.
+    """
+
+    url: str
+    title: str
+    snippet: str
+    rich_snippet: str
 
 
 class GoogleHtmlParser:
@@ -11,25 +151,173 @@ class GoogleHtmlParser:
     Attributes:
         tree: Holds the document object element parsed through html.fromstring()
         user_agent: Holds the user agent used to retrieve the Google Search HTML.
+        backend: Holds the HTML parser backend, either lxml or lexbor.
     """
 
-    def __init__(self, html_str, user_agent='desktop') -> None:
+    # XPath expressions are compiled once, when the class is created, and shared by
+    # every instance instead of being parsed again on each call.
+    # id() is answered from libxml2's ID table instead of scanning the document.
+    _X_STATS = etree.XPath('id("result-stats")/text()')
+    _X_G = etree.XPath('//div[@class="g"]')
+    # Everything an organic result needs, fetched with a single query: the first
+    # href, the first h3 text, the snippet divs and any review stars below them.
+    _X_ORGANIC_PARTS = etree.XPath(
+        '(.//@href)[1] | (.//h3/text())[1] | .//div/div/div[2]/div'
+        ' | .//div/div/div[2]/div//g-review-stars')
+    _X_H3_TEXT = etree.XPath('.//h3/text()')
+    _X_A_HREF = etree.XPath('.//a/@href')
+    # Only the first featured snippet and knowledge card are used. Most SERPs have
+    # neither, and a missing block has to be searched for in the whole document, which
+    # libxml2 does faster than a walk over the divs in Python.
+    _X_KPBLK = etree.XPath('(//div[contains(@class, "kp-blk")])[1]')
+    _X_KPWHOLEPAGE = etree.XPath('(//div[contains(@class, "kp-wholepage")])[1]')
+    _X_ATTRID_CONTAINS = etree.XPath('.//div[contains(@data-attrid, $needle)]')
+    _X_SPAN = etree.XPath('.//span')
+    _X_A = etree.XPath('.//a')
+    _X_DIV = etree.XPath('.//div')
+    _X_HEADING = etree.XPath('.//div[@role="heading"]')
+    # Whether the context node has a role="list" div ancestor below $root.
+    _X_IN_LIST = etree.XPath(
+        'count(ancestor::div[@role="list"]) > count($root/ancestor::div[@role="list"])')
+    _X_TITLE_DIV = etree.XPath('.//div[@class="title"]')
+    _X_SIDEWAYS = etree.XPath('.//div[@data-reltype="sideways"]')
+    _X_SECTIONS = etree.XPath('//g-section-with-header')
+    _X_H3 = etree.XPath('.//h3')
+    _X_INNER_CARDS = etree.XPath('.//g-inner-card')
+    _X_HEADING_TEXT = etree.XPath('.//div[@role="heading"]/text()')
+
+    def __init__(self, html_str, user_agent='desktop', backend='lxml') -> None:
         """Create the document tree.
 
         Parses the provided HTML string using html.fromstring() and
         sets the parsed object in the tree attribute.
 
+        With the lexbor backend the HTML is parsed with selectolax instead, which is
+        considerably faster. Organic results, the featured snippet and the estimated
+        results count are then extracted from the selectolax tree, while the lxml tree
+        is only parsed if the knowledge card or the scrolling widgets are requested.
+        get_data() requests both, so with the lexbor backend it parses the HTML twice;
+        lexbor only pays off when calling the individual extraction methods.
+
         Args:
             html_str: Google Search HTML source as a string.
             user_agent: User agent used to get the Google Search HTML. Can be either
                         mobile or desktop
+            backend: HTML parser to use. Can be either lxml or lexbor, lexbor requires
+                     the selectolax package.
+
+        Raises:
+            ImportError: The lexbor backend was requested but selectolax isn't installed.
         """
-        self.tree = html.fromstring(html_str)
+        tree = None
+        lexbor = None
+        if backend == 'lexbor':
+            if LexborHTMLParser is None:
+                raise ImportError('The lexbor backend requires selectolax, install it with: '
+                                  'pip install selectolax')
+            lexbor = LexborHTMLParser(html_str)
+        else:
+            tree = html.fromstring(html_str)
+
+        self._setup(html_str, tree, lexbor, user_agent)
+
+    def _setup(self, html_str, tree, lexbor, user_agent) -> None:
+        """Set the parsed documents and the user agent.
+
+        Shared by the constructor and the alternative constructors that provide an
+        already parsed tree.
+
+        Args:
+            html_str: Google Search HTML source as a string, or None if tree is set.
+                      Only kept for the lexbor backend, to parse the lxml tree later.
+            tree: The lxml document tree, or None to parse html_str on first access.
+            lexbor: The selectolax tree for the lexbor backend, or None.
+            user_agent: User agent used to get the Google Search HTML. Can be either
+                        mobile or desktop
+        """
+        self._html_str = html_str if lexbor is not None else None
+        self._tree = tree
+        self._lexbor = lexbor
+        self.backend = 'lxml' if lexbor is None else 'lexbor'
+
         if user_agent in ['mobile', 'desktop']:
             self.user_agent = user_agent
         else:
             self.user_agent = 'desktop'
 
+    @classmethod
+    def from_parsed_tree(cls, tree, user_agent='desktop') -> 'GoogleHtmlParser':
+        """Create a parser for an already parsed document tree.
+
+        The tree is used as is and isn't modified by the parser, so it can be shared
+        between several parser instances, i.e. to extract both the desktop and the
+        mobile data from the same document.
+
+        Args:
+            tree: Document root element as returned by html.fromstring().
+            user_agent: User agent used to get the Google Search HTML. Can be either
+                        mobile or desktop
+
+        Returns:
+            A GoogleHtmlParser instance using the provided tree.
+        """
+        parser = cls.__new__(cls)
+        parser._setup(None, tree, None, user_agent)
+        return parser
+
+    @classmethod
+    def from_stream(cls, chunks, user_agent='desktop', encoding=None) -> 'GoogleHtmlParser':
+        """Create a parser by feeding the HTML to lxml as it arrives.
+
+        Parsing starts with the first chunk instead of waiting for the whole response
+        body, i.e. pass requests.Response.iter_content() of a streamed request.
+
+        Args:
+            chunks: An iterable of the HTML source as bytes or strings.
+            user_agent: User agent used to get the Google Search HTML. Can be either
+                        mobile or desktop
+            encoding: Encoding of the chunks if they are bytes, i.e. the encoding of the
+                      HTTP response. If None, it is detected from the HTML.
+
+        Returns:
+            A GoogleHtmlParser instance using the parsed tree.
+        """
+        parser = html.HTMLParser(encoding=encoding)
+        for chunk in chunks:
+            parser.feed(chunk)
+        tree = parser.close()
+        return cls.from_parsed_tree(tree, user_agent)
+
+    @classmethod
+    def from_cached(cls, html_str, user_agent='desktop') -> 'GoogleHtmlParser':
+        """Create a parser, reusing the parsed tree if the HTML was parsed recently.
+
+        Useful for pipelines that instantiate the parser repeatedly for the same HTML,
+        i.e. on retries. The most recently used trees are kept in a small cache shared
+        by all callers.
+
+        Args:
+            html_str: Google Search HTML source as a string.
+            user_agent: User agent used to get the Google Search HTML. Can be either
+                        mobile or desktop
+
+        Returns:
+            A GoogleHtmlParser instance using the cached tree.
+        """
+        return cls.from_parsed_tree(_parse_html_cached(html_str), user_agent)
+
+    @property
+    def tree(self):
+        """The lxml document tree, parsed on first access with the lexbor backend."""
+        if self._tree is None:
+            self._tree = html.fromstring(self._html_str)
+            self._html_str = None
+        return self._tree
+
+    @tree.setter
+    def tree(self, tree) -> None:
+        self._tree = tree
+
     def _clean(self, content) -> str:
         """Clean content.
 
@@ -43,18 +331,45 @@ class GoogleHtmlParser:
         """
 
         if content:
-            # Deal unicode strings
-            # content = content.encode('ascii', 'ignore').decode('utf-8')
+            return _clean_str(content)
+        return ''
+    
+    def _text_content(self, el) -> str:
+        """Get the text content of an element.
 
-            # Strip whitespaces
-            content = content.strip()
+        For elements without children the text is read directly from the element,
+        which avoids the subtree walk of text_content(). Other elements fall back to
+        text_content().
 
-            # Convert multiple spaces to one
-            content = ' '.join(content.split())
+        Args:
+            el: The element to get the text of.
+
+        Returns:
+            The text of the element and all of its descendants.
+        """
+        if len(el) == 0:
+            return el.text or ''
+        return el.text_content()
+
+    def _clean_many(self, contents) -> list:
+        """Clean many strings at once.
+
+        Joins the strings with a NUL separator, which HTML text can't contain and which
+        isn't whitespace, and cleans the joined string with a single call. Cheaper than
+        calling _clean() for every string when there are many of them.
+
+        Args:
+            contents: An iterable of strings to clean, None is treated as an empty string.
+
+        Returns:
+            A list of the cleaned strings, in the order of contents.
+        """
+        contents = [content or '' for content in contents]
+        if not contents:
+            return []
+        joined = '\x00'.join(contents)
+        return [part.strip() for part in self._clean(joined).split('\x00')]
 
-            return content
-        return ''
-    
     def _normalize_dict_key(self, content) -> str:
         """Takes a string and makes it a standard dict key.
         
@@ -83,9 +398,13 @@ class GoogleHtmlParser:
             An integer of the estimated results count parsed from the tag div with ID result-stats.
         """
         estimated_results = 0
-        estimated_el = self.tree.xpath(
-            '//*[@id="result-stats"]/text()')
-        if len(estimated_el) > 0:
+        if self._lexbor is not None:
+            stats_el = self._lexbor.css_first('[id="result-stats"]')
+            stats_text = _lexbor_first_text(stats_el) if stats_el is not None else None
+            estimated_el = [stats_text] if stats_text is not None else []
+        else:
+            estimated_el = self._X_STATS(self.tree)
+        if estimated_el:
             estimated_results = int(
                 estimated_el[0].split()[1].replace(',', ''))
         return estimated_results
@@ -97,31 +416,108 @@ class GoogleHtmlParser:
         contain other search features like featured snippets, people also ask section etc.
 
         Returns:
-            A list of organic Google Search results is returned.
+            A list of organic Google Search results is returned as OrganicResult tuples.
         """
-        organic = []
-        for g in self.tree.xpath('//div[@class="g"]'):
-            snippets = g.xpath('.//div/div/div[2]/div')
+        if self._lexbor is not None:
+            return self._get_organic_lexbor()
+
+        raw_results = []
+        for g in self._X_G(self.tree):
+            url = None
+            title = None
+            snippets = []
+            review_stars = []
+            for part in self._X_ORGANIC_PARTS(g):
+                if isinstance(part, str):
+                    if part.is_attribute:
+                        url = part
+                    else:
+                        title = part
+                elif part.tag == 'g-review-stars':
+                    review_stars.append(part)
+                else:
+                    snippets.append(part)
+
             snippet = None
             rich_snippet = None
             if len(snippets) == 1:
-                snippet = snippets[0].text_content()
+                snippet = self._text_content(snippets[0])
             elif len(snippets) > 1:
-                if len(snippets[1].xpath('.//g-review-stars')) > 0:
-                    rich_snippet = snippets[1].text_content()
-                    snippet = snippets[0].text_content()
+                if any(ancestor is snippets[1]
+                       for stars in review_stars for ancestor in stars.iterancestors()):
+                    rich_snippet = self._text_content(snippets[1])
+                    snippet = self._text_content(snippets[0])
                 else:
-                    snippet = snippets[1].text_content()
-                    rich_snippet = snippets[0].text_content()
-
-            res = {
-                'url': self._clean(g.xpath('.//@href[1]')[0]),
-                'title': self._clean(g.xpath('.//h3/text()')[0]),
-                'snippet': self._clean(snippet),
-                'rich_snippet': self._clean(rich_snippet),
-            }
-            organic.append(res)
-        return organic
+                    snippet = self._text_content(snippets[1])
+                    rich_snippet = self._text_content(snippets[0])
+
+            raw_results.append((url, title, snippet, rich_snippet))
+        return self._to_organic_results(raw_results)
+
+    def _get_organic_lexbor(self) -> list:
+        """Get organic results from the selectolax tree.
+
+        Same as _get_organic(), with the XPath expressions mapped onto CSS selectors.
+
+        Returns:
+            A list of organic Google Search results is returned as OrganicResult tuples.
+        """
+        raw_results = []
+        for g in self._lexbor.css('div[class="g"]'):
+            # CSS combinators may also match g and its ancestors, so only keep the
+            # snippet divs whose outermost div lies below g, as .//div/div/div[2]/div
+            # requires. Nodes are compared by mem_id, as == compares their serialized
+            # HTML.
+            snippets = []
+            for snippet_el in g.css('div > div > div:nth-of-type(2) > div'):
+                ancestor = snippet_el.parent.parent.parent.parent
+                while ancestor is not None and ancestor.mem_id != g.mem_id:
+                    ancestor = ancestor.parent
+                if ancestor is not None:
+                    snippets.append(snippet_el)
+
+            snippet = None
+            rich_snippet = None
+            if len(snippets) == 1:
+                snippet = snippets[0].text()
+            elif len(snippets) > 1:
+                if snippets[1].css_first('g-review-stars') is not None:
+                    rich_snippet = snippets[1].text()
+                    snippet = snippets[0].text()
+                else:
+                    snippet = snippets[1].text()
+                    rich_snippet = snippets[0].text()
+
+            url = g.attributes.get('href')
+            if url is None:
+                href_el = g.css_first('[href]')
+                url = href_el.attributes.get('href') if href_el is not None else None
+
+            title = None
+            for h3 in g.css('h3'):
+                title = _lexbor_first_text(h3)
+                if title is not None:
+                    break
+
+            raw_results.append((url, title, snippet, rich_snippet))
+        return self._to_organic_results(raw_results)
+
+    def _to_organic_results(self, raw_results) -> list:
+        """Clean the raw organic results and turn them into OrganicResult tuples.
+
+        Args:
+            raw_results: A list of (url, title, snippet, rich_snippet) tuples of the
+                         uncleaned strings.
+
+        Returns:
+            A list of OrganicResult tuples.
+        """
+        fields = iter(self._clean_many(
+            [content for raw_result in raw_results for content in raw_result[1:]]))
+        # Hrefs are percent-encoded and can't contain whitespace, apart from padding
+        # around the attribute value, so a plain strip() is all the cleaning they need.
+        return [OrganicResult((raw_result[0] or '').strip(), *parts)
+                for raw_result, parts in zip(raw_results, zip(fields, fields, fields))]
 
     def _get_featured_snippet(self) -> dict:
         """Get the featured snippet if exists.
@@ -138,14 +534,15 @@ class GoogleHtmlParser:
                 }
                 
         """
+        if self._lexbor is not None:
+            return self._get_featured_snippet_lexbor()
+
         fs = None
-        snipp_el = self.tree.xpath(
-            '//div[contains(concat(" ", @class, " "), "kp-blk")]')
-        if len(snipp_el) > 0:
-            snipp_el = snipp_el[0]
-            heading = snipp_el.xpath('.//h3/text()')
-            url = snipp_el.xpath('.//a/@href')
-            if all([len(item) > 0 for item in [heading, url]]):
+        snipp_el = next(iter(self._X_KPBLK(self.tree)), None)
+        if snipp_el is not None:
+            heading = self._X_H3_TEXT(snipp_el)
+            url = self._X_A_HREF(snipp_el)
+            if heading and url:
                 fs = {
                     'title': heading[0],
                     'url': url[-1]
@@ -153,6 +550,32 @@ class GoogleHtmlParser:
 
         return fs
     
+    def _get_featured_snippet_lexbor(self) -> dict:
+        """Get the featured snippet from the selectolax tree if exists.
+
+        Same as _get_featured_snippet(), with the XPath expressions mapped onto CSS
+        selectors.
+
+        Returns:
+           any: A dict if featured snippet is found and None otherwise.
+        """
+        fs = None
+        snipp_el = self._lexbor.css_first('div[class*="kp-blk"]')
+        if snipp_el is not None:
+            heading = None
+            for h3 in snipp_el.css('h3'):
+                heading = _lexbor_first_text(h3)
+                if heading is not None:
+                    break
+            url = [a.attributes['href'] for a in snipp_el.css('a[href]')]
+            if heading is not None and url:
+                fs = {
+                    'title': heading,
+                    'url': url[-1]
+                }
+
+        return fs
+
     def _get_knowledge_card(self) -> dict:
         """Gets the knowledge card data if exists.
         
@@ -164,37 +587,43 @@ class GoogleHtmlParser:
         Returns:
             A dictionary if knowledge card exists, or None if it doesn't exist.
         """
-        kc_el = self.tree.xpath('//div[contains(concat(" ", @class, " "), "kp-wholepage")]')
-        if len(kc_el):
-            kc_el = kc_el[0]
+        kc_el = next(iter(self._X_KPWHOLEPAGE(self.tree)), None)
+        if kc_el is not None:
             more_info = []
-            for el in kc_el.xpath('.//div[contains(@data-attrid, ":/")]'):
-                el_parts = el.xpath('.//span')
+            for el in self._X_ATTRID_CONTAINS(kc_el, needle=':/'):
+                el_parts = self._X_SPAN(el)
                 if len(el_parts) == 2:
                     more_info.append({
-                        self._normalize_dict_key(el_parts[0].text_content()): el_parts[1].text_content()
+                        self._normalize_dict_key(self._text_content(el_parts[0])):
+                            self._text_content(el_parts[1])
                     })
                 else:
-                    heading = el.xpath('.//div[@role="heading"]')
-                    if len(heading) > 0:
-                        heading_anchor = heading[0].xpath('.//a')
-                        if len(heading_anchor) > 0:
-                            dict_key = self._normalize_dict_key(heading_anchor[0].text_content())
+                    # Collect the headings in one pass. The ones inside a list are the
+                    # list items, the first one outside of a list is the section heading.
+                    heading = None
+                    list_items = []
+                    for heading_el in self._X_HEADING(el):
+                        if self._X_IN_LIST(heading_el, root=el):
+                            list_items.append(heading_el)
+                        elif heading is None:
+                            heading = heading_el
+
+                    if heading is not None:
+                        heading_anchor = self._X_A(heading)
+                        if heading_anchor:
+                            dict_key = self._normalize_dict_key(self._text_content(heading_anchor[0]))
                             
                             dict_items = []
-                            for item_div in el.xpath('.//div[@role="list"]'):
-                                
-                                # Get list items
-                                for item in item_div.xpath('.//div[@role="heading"]'):
-                                    if len(item):
-                                        dict_items.append({
-                                            'title': item.xpath('.//div[@class="title"]')[0].text_content(),
-                                            'subtitle': item.xpath('.//div')[1].text_content()
-                                        })
+                            for item in list_items:
+                                if len(item):
+                                    dict_items.append({
+                                        'title': self._text_content(self._X_TITLE_DIV(item)[0]),
+                                        'subtitle': self._text_content(self._X_DIV(item)[1])
+                                    })
                         
                             if dict_key == 'people_also_search_for':
-                                for pasf in el.xpath('.//div[@data-reltype="sideways"]'):
-                                    dict_items.append(pasf.text_content())
+                                for pasf in self._X_SIDEWAYS(el):
+                                    dict_items.append(self._text_content(pasf))
                                 
                             
                             more_info.append({
@@ -202,9 +631,9 @@ class GoogleHtmlParser:
                             })
             
             return {
-                'title': kc_el.xpath('.//h2/span')[0].text_content(),
-                'subtitle': kc_el.xpath('.//div[contains(@data-attrid, "subtitle")]')[0].text_content(),
-                'description': kc_el.xpath('.//div[@class="kno-rdesc"]/span')[0].text_content(),
+                'title': self._text_content(kc_el.find('.//h2/span')),
+                'subtitle': self._text_content(self._X_ATTRID_CONTAINS(kc_el, needle='subtitle')[0]),
+                'description': self._text_content(kc_el.find('.//div[@class="kno-rdesc"]/span')),
                 'more_info': more_info
             }
         
@@ -220,23 +649,23 @@ class GoogleHtmlParser:
             list: Returns a list of the results. The list will either contain results or it will be 
                     empty if no results are found.
         """
-        sections = self.tree.xpath('//g-section-with-header')
+        sections = self._X_SECTIONS(self.tree)
         
         data = []
-        if len(sections):
+        if sections:
             for section in sections:
-                section_title = section.xpath('.//h3')
+                section_title = self._X_H3(section)
                 if section_title:
-                    title = section_title[0].text_content()
+                    title = self._text_content(section_title[0])
                     if title:
                         section_data = []
-                        data_sections = section.xpath('.//g-inner-card')
-                        if len(data_sections):
+                        data_sections = self._X_INNER_CARDS(section)
+                        if data_sections:
                             for data_section in data_sections:
-                                data_title = data_section.xpath('.//div[@role="heading"]/text()')
-                                data_url = data_section.xpath('.//a/@href')
+                                data_title = self._X_HEADING_TEXT(data_section)
+                                data_url = self._X_A_HREF(data_section)
                                 
-                                if all(len(item) > 0 for item in [data_title, data_url]):
+                                if data_title and data_url:
                                     section_data.append({
                                         'title': self._clean(data_title[0]),
                                         'url': self._clean(data_url[0])
@@ -247,24 +676,87 @@ class GoogleHtmlParser:
                     })
         return data
 
-    def get_data(self) -> dict:
+    def get_data(self, as_dict=True) -> dict:
         """Get the final data.
 
         Get the data including organic search results, estimated results count, and other
         elements as a dict.
 
+        Args:
+            as_dict: Return the organic results as dicts. If False, they are returned as
+                     OrganicResult tuples, which skips the conversion.
+
         Returns:
             A dict that contains all SERP data including estimated results count, organic
             results, and more.
         """
-        data = {}
         if self.user_agent == 'desktop':
-            data = {
-                'estimated_results': self._get_estimated_results(),
-                'featured_snippet': self._get_featured_snippet(),
-                'knowledge_card': self._get_knowledge_card(),
-                'organic_results': self._get_organic(),
-                'scrolling_widgets': self._get_scrolling_sections()
-            }
+            return self._get_data_desktop(as_dict)
+        return self._get_data_mobile(as_dict)
+
+    def _get_data_desktop(self, as_dict=True) -> dict:
+        """Get the final data from a desktop SERP.
+
+        Args:
+            as_dict: Return the organic results as dicts instead of OrganicResult tuples.
 
-        return data
\ No newline at end of file
+        Returns:
+            A dict that contains all SERP data.
+        """
+        organic = self._get_organic()
+        if as_dict:
+            organic = [result._asdict() for result in organic]
+
+        return {
+            'estimated_results': self._get_estimated_results(),
+            'featured_snippet': self._get_featured_snippet(),
+            'knowledge_card': self._get_knowledge_card(),
+            'organic_results': organic,
+            'scrolling_widgets': self._get_scrolling_sections()
+        }
+
+    def _get_data_mobile(self, as_dict=True) -> dict:
+        """Get the final data from a mobile SERP.
+
+        Parsing the mobile SERP isn't supported yet, so the data is always empty.
+
+        Args:
+            as_dict: Return the organic results as dicts instead of OrganicResult tuples.
+
+        Returns:
+            An empty dict.
+        """
+        return {}
+
+
+def _parse_one(html_str, user_agent) -> dict:
+    """Parse a single SERP in a worker process and return its data.
+
+    Only the extracted data leaves the worker, so the tree can be indexed.
+    """
+    tree = _parse_html_indexed(html_str)
+    return GoogleHtmlParser.from_parsed_tree(tree, user_agent).get_data()
+
+
+def parse_many(html_strs, user_agent='desktop', workers=None, chunksize=8) -> list:
+    """Parse many Google Search HTML pages in parallel.
+
+    Both the HTML parsing and the Python side extraction run in a pool of worker
+    processes, so the work scales across CPU cores instead of being serialized by the
+    GIL. This is the recommended entry point for batches of more than ten pages; for
+    fewer pages the cost of starting the workers outweighs the gain.
+
+    Args:
+        html_strs: An iterable of Google Search HTML sources as strings.
+        user_agent: User agent used to get the Google Search HTML. Can be either
+                    mobile or desktop
+        workers: Number of worker processes, defaults to the number of CPUs.
+        chunksize: Number of pages sent to a worker at once, to amortize the cost of
+                   passing data between processes.
+
+    Returns:
+        A list with the data dict of every page, in the order of html_strs.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_parse_one, html_strs, itertools.repeat(user_agent),
+                                 chunksize=chunksize))
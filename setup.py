@@ -1,4 +1,36 @@
-from setuptools import setup
+import sys
+
+from setuptools import Extension, setup
+
+# The compiled helpers are optional, the package falls back to pure Python if they
+# can't be built. AVX2 code is enabled per function and picked at runtime, so no
+# -mavx2 here.
+ext_modules = [
+    Extension('htmlparsers._clean_simd', ['htmlparsers/_clean_simd.c'],
+              extra_compile_args=[] if sys.platform == 'win32' else ['-O3'],
+              optional=True)
+]
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    pass
+else:
+    ext_modules += cythonize([
+        Extension('htmlparsers._clean', ['htmlparsers/_clean.pyx'], optional=True)
+    ])
+
+    # Reads the libxml2 document through lxml's public C API, which needs lxml's
+    # headers at build time.
+    try:
+        import lxml
+    except ImportError:
+        pass
+    else:
+        ext_modules += cythonize([
+            Extension('htmlparsers._docorder', ['htmlparsers/_docorder.pyx'],
+                      include_dirs=lxml.get_include(), optional=True)
+        ])
 
 setup(name='htmlparsers',
       version='0.0.1',
@@ -13,5 +45,10 @@ setup(name='htmlparsers',
               'google_search.py'
           ]},
       include_package_data=True,
+      ext_modules=ext_modules,
       install_requires=['lxml>=4.6',
-                        'requests>=2.25'])
+                        'requests>=2.25'],
+      extras_require={
+          # GoogleHtmlParser(..., backend='lexbor')
+          'lexbor': ['selectolax>=0.3.21'],
+      })
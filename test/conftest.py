@@ -0,0 +1,85 @@
+import importlib.util
+import os
+import pathlib
+
+import pytest
+
+# requests and vcrpy are only imported by the fixtures that use them, so that
+# collecting the offline tests doesn't pay for loading them
+HAS_VCR = importlib.util.find_spec('vcr') is not None
+
+# Recorded live fetch, replayed instead of hitting google.com when it exists
+CASSETTE = pathlib.Path(__file__).with_name('fixtures') / 'google_data_science.yaml'
+
+GOOGLE_SEARCH_URL = 'https://www.google.com/search'
+GOOGLE_KEYWORD = 'data science'
+GOOGLE_HEADERS = {
+    'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36'
+}
+
+
+def pytest_addoption(parser) -> None:
+    """Add the --record-mode option for the live Google Search cassette."""
+    parser.addoption('--record-mode', default='once',
+                     choices=('none', 'once', 'new_episodes', 'all'),
+                     help='vcrpy record mode for the google.com cassette, use '
+                          'new_episodes or all with GOOGLE_LIVE_TESTS=1 to refresh it')
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_auto_num_workers(config) -> int:
+    """Number of workers for pytest -n auto.
+
+    Leaves two cores free for the rest of the system, which keeps CI machines
+    responsive while the suite runs. Run with -n auto --dist=loadfile, loadfile keeps
+    every test of a module on one worker so the SERP parsed in setUpClass is shared.
+    """
+    return max(1, (os.cpu_count() or 1) - 2)
+
+
+@pytest.fixture(scope='session')
+def google_session():
+    """A requests session shared by every test module that fetches from Google.
+
+    Reusing one connection pool avoids a new TLS handshake per module.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    with requests.Session() as session:
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        yield session
+
+
+@pytest.fixture(scope='session')
+def google_html(request) -> str:
+    """The Google Search HTML for the test keyword, fetched once per session.
+
+    If vcrpy is installed the fetch goes through a cassette: it is replayed from
+    CASSETTE when recorded, and recorded there otherwise. Without a cassette the
+    requesting test is skipped unless GOOGLE_LIVE_TESTS is set.
+    """
+    replay = HAS_VCR and CASSETTE.exists()
+    if not replay and not os.environ.get('GOOGLE_LIVE_TESTS'):
+        pytest.skip('set GOOGLE_LIVE_TESTS=1 to test against google.com')
+
+    # Requested only now, so that skipped runs don't create the session
+    google_session = request.getfixturevalue('google_session')
+
+    def fetch() -> str:
+        res = google_session.get(GOOGLE_SEARCH_URL, params={'q': GOOGLE_KEYWORD, 'num': 100},
+                                 headers=GOOGLE_HEADERS)
+        res.raise_for_status()
+        return res.text
+
+    if not HAS_VCR:
+        return fetch()
+
+    import vcr
+
+    record_mode = request.config.getoption('--record-mode')
+    with vcr.use_cassette(str(CASSETTE), record_mode=record_mode,
+                          decode_compressed_response=True):
+        return fetch()
@@ -0,0 +1,110 @@
+import random
+import unittest
+
+try:
+    from htmlparsers._clean import clean as clean_cython
+except ImportError:
+    clean_cython = None
+
+try:
+    from htmlparsers._clean_simd import clean as clean_simd
+except ImportError:
+    clean_simd = None
+
+# Every character below 256 that str.split() treats as whitespace, including the
+# Latin-1 ones, the NUL separator used by GoogleHtmlParser._clean_many(), and
+# characters that need two or four bytes per character.
+LATIN1_ALPHABET = ' \t\n\x0b\x0c\r\x1c\x1d\x1e\x1f\x85\xa0\x00ab\xe9\xff.'
+# The BMP adds whitespace from U+1680 up, characters just around it, and the dash
+# and quotes that are common in SERP snippets.
+BMP_ALPHABET = (LATIN1_ALPHABET + '\u1680\u167f\u1681\u2000\u200a\u200b\u2028\u2029'
+                '\u202f\u205f\u3000\u2014\u201c\u2026\u20ac\u65e5\uffff')
+WIDE_ALPHABET = BMP_ALPHABET + '\U0001d518'
+
+
+def reference_clean(content) -> str:
+    """The pure Python implementation the compiled ones have to match."""
+    return ' '.join(content.split())
+
+
+def random_strings(alphabet, count=5000, seed=0) -> list:
+    """Generate random strings from the alphabet.
+
+    The strings are built from runs of whitespace and of other characters of up to
+    40 characters, so the SIMD implementation sees blocks of only whitespace, blocks
+    without whitespace and mixed blocks, as well as the scalar tail after them.
+
+    Args:
+        alphabet: The characters to build the strings from.
+        count: Number of strings to generate.
+        seed: Seed of the random generator, so failures can be reproduced.
+
+    Returns:
+        A list of strings.
+    """
+    rng = random.Random(seed)
+    spaces = [ch for ch in alphabet if ch.isspace()]
+    others = [ch for ch in alphabet if not ch.isspace()]
+    strings = ['', ' ', '\x00', ' \x00 ', 'a\xa0\x85b', ' ' * 64, 'a' * 64]
+    for _ in range(count):
+        runs = []
+        for _ in range(rng.randrange(8)):
+            chars = rng.choice((spaces, others, alphabet))
+            runs.append(''.join(rng.choice(chars) for _ in range(rng.randrange(1, 41))))
+        strings.append(''.join(runs))
+    return strings
+
+
+@unittest.skipIf(clean_cython is None, 'the Cython extension htmlparsers._clean is not built')
+class TestCleanCython(unittest.TestCase):
+    """Test the Cython implementation of _clean."""
+
+    def test_matches_reference(self) -> None:
+        """Test equivalence.
+
+        Ensure that the output matches the pure Python implementation, for Latin-1 and
+        wide strings.
+        """
+        for content in random_strings(WIDE_ALPHABET):
+            self.assertEqual(clean_cython(content), reference_clean(content), repr(content))
+
+    def test_str_subclass(self) -> None:
+        """Test str subclasses.
+
+        lxml returns its text as str subclasses, these have to be accepted as well.
+        """
+        class SmartString(str):
+            pass
+
+        self.assertEqual(clean_cython(SmartString(' a \x85 b ')), 'a b')
+
+
+@unittest.skipIf(clean_simd is None, 'the C extension htmlparsers._clean_simd is not built')
+class TestCleanSimd(unittest.TestCase):
+    """Test the SIMD implementation of _clean."""
+
+    def test_matches_reference(self) -> None:
+        """Test equivalence.
+
+        Ensure that the output matches the pure Python implementation for Latin-1
+        strings.
+        """
+        for content in random_strings(LATIN1_ALPHABET):
+            self.assertEqual(clean_simd(content), reference_clean(content), repr(content))
+
+    def test_matches_reference_bmp(self) -> None:
+        """Test equivalence for two bytes per character.
+
+        Ensure that the output matches the pure Python implementation for strings with
+        characters beyond Latin-1 within the Basic Multilingual Plane.
+        """
+        for content in random_strings(BMP_ALPHABET, seed=1):
+            self.assertEqual(clean_simd(content), reference_clean(content), repr(content))
+
+    def test_wide_strings(self) -> None:
+        """Test strings beyond the Basic Multilingual Plane.
+
+        Ensure that None is returned, so the caller falls back to another implementation.
+        """
+        for content in ('\U0001d518', 'a\u3000b \U0001d518', ' ' * 40 + '\U0001d518'):
+            self.assertIsNone(clean_simd(content), repr(content))
@@ -1,14 +1,24 @@
+import os
+import pathlib
 import unittest
 import json
 
-from htmlparsers.google_search import GoogleHtmlParser
-import requests
+from htmlparsers.google_search import GoogleHtmlParser, LexborHTMLParser, OrganicResult, parse_many
+from lxml import html
+import pytest
+
+FIXTURE = pathlib.Path(__file__).with_name('fixtures') / 'google_data_science.html'
+
+# A page that isn't a Google SERP, parsed once when the module is imported
+_INVALID_HTML = '<html><head><title>Not found</title></head><body><p>Not a Google Search page</p></body></html>'
+_INVALID_PARSER = GoogleHtmlParser(html_str=_INVALID_HTML)
 
 
 class TestGoogleHtmlParser(unittest.TestCase):
     """Test Google HTML Parser.
 
     This test case tests the GoogleHtmlParser class to ensure that it works as expected.
+    The HTML is loaded from a fixture file, refresh it with tools/refresh_fixture.py.
     """
 
     @classmethod
@@ -17,66 +27,54 @@ class TestGoogleHtmlParser(unittest.TestCase):
 
         Setup the resources that we need to rely on in order to perform the tests.
         """
-        cls.client = requests.session()
-        headers = {
-            'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36'
-        }
-        keyword = 'data science'
-        res = cls.client.get(
-            f'https://www.google.com/search?q={keyword}&num=100', headers=headers)
-        cls.parser = GoogleHtmlParser(html_str=res.text)
+        cls.parser = GoogleHtmlParser(html_str=FIXTURE.read_text(encoding='utf-8'))
+
+        # Parse the organic results once for all tests that only read them
+        cls._organic = cls.parser._get_organic()
 
     @classmethod
     def tearDownClass(cls) -> None:
-        """Close the client.
+        """Store the data.
 
-        Close the requests client as well as store the SERPs data as JSON to a file.
+        Store the SERPs data as JSON to a file, if DUMP_SERP_JSON is set.
         """
-        cls.client.close()
-        
-        data = cls.parser.get_data()
-        with open('./data.json', 'w') as f:
-            f.write(json.dumps(data))
+        if os.environ.get('DUMP_SERP_JSON'):
+            data = cls.parser.get_data()
+            with open('./data.json', 'w') as f:
+                json.dump(data, f)
 
     def test__get_organic(self) -> None:
         """Test organic results.
 
         Test organic results and ensure that the results are parsed correctly.
         """
-        results = self.parser._get_organic()
+        results = self._organic
 
         # Ensure that the data is a list
-        self.assertEqual(type(results), list)
+        self.assertIsInstance(results, list)
 
         # Confirm that the data has results
         self.assertGreater(len(results), 1)
 
-    def test_results_has_url(self) -> None:
-        """Test URL.
-
-        Test that the result dict has the URL value set.
-        """
-        results = self.parser._get_organic()
-        for result in results:
-            self.assertNotEqual(result.get('url'), None)
-
-    def test_results_has_title(self) -> None:
-        """Test title.
-
-        Ensure that the result dict has the title value set.
-        """
-        results = self.parser._get_organic()
-        for result in results:
-            self.assertNotEqual(result.get('title'), None)
-
-    def test_results_has_snippet(self) -> None:
-        """Test meta description snippet.
+    def test_results_have_required_fields(self) -> None:
+        """Test URL, title and meta description snippet.
 
-        Ensure that the result dict has the snippet value set.
+        Ensure that every result has the URL, title and snippet set. Only the result of
+        the featured snippet has no snippet, its text is shown in the featured snippet.
         """
-        results = self.parser._get_organic()
-        for result in results:
-            self.assertNotEqual(result.get('snippet'), None)
+        featured = self.parser._get_featured_snippet()
+        featured_url = featured['url'] if featured else None
+        checks = (
+            ('url', lambda result: result.url),
+            ('title', lambda result: result.title),
+            ('snippet', lambda result: result.snippet or result.url == featured_url),
+        )
+        for key, is_set in checks:
+            with self.subTest(key=key):
+                if not all(is_set(result) for result in self._organic):
+                    index = next(i for i, result in enumerate(self._organic)
+                                 if not is_set(result))
+                    self.fail(f'result {index} has no {key}')
 
     def test__get_estimated_results(self) -> None:
         """Test estimated results.
@@ -84,7 +82,7 @@ class TestGoogleHtmlParser(unittest.TestCase):
         Ensure that we get the estimated results count from Google as an integer.
         """
         estimated_results = self.parser._get_estimated_results()
-        self.assertEqual(type(estimated_results), int)
+        self.assertIsInstance(estimated_results, int)
 
     def test_get_data(self) -> None:
         """Test final data.
@@ -92,7 +90,7 @@ class TestGoogleHtmlParser(unittest.TestCase):
         Ensure that we get the final data in form of a dictionary.
         """
         final_data = self.parser.get_data()
-        self.assertEqual(type(final_data), dict)
+        self.assertIsInstance(final_data, dict)
 
     def test_featured_snippet(self) -> None:
         """Test featured snippet.
@@ -101,7 +99,7 @@ class TestGoogleHtmlParser(unittest.TestCase):
         or None.
         """
         fs = self.parser._get_featured_snippet()
-        self.assertTrue(type(fs) in [None, dict])
+        self.assertIsInstance(fs, (dict, type(None)))
     
     def test__get_knowledge_card(self) -> None:
         """Test knowledge card data.
@@ -110,7 +108,7 @@ class TestGoogleHtmlParser(unittest.TestCase):
         as expected.
         """
         kc = self.parser._get_knowledge_card()
-        self.assertTrue(type(kc) in [None, dict])
+        self.assertIsInstance(kc, (dict, type(None)))
     
     def test__get_scrolling_sections(self) -> None:
         """Test scrolling widgets.
@@ -119,5 +117,157 @@ class TestGoogleHtmlParser(unittest.TestCase):
         as expected.
         """
         sw = self.parser._get_scrolling_sections()
-        self.assertEqual(type(sw), list)
-        
+        self.assertIsInstance(sw, list)
+
+
+class TestGoogleHtmlParserConstructors(unittest.TestCase):
+    """Test the alternative ways of creating a Google HTML Parser.
+
+    Every constructor has to produce the same data as parsing the HTML string.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Setup test resources.
+
+        Parse the fixture the regular way to get the data to compare against.
+        """
+        cls.html_bytes = FIXTURE.read_bytes()
+        cls.html_str = cls.html_bytes.decode('utf-8')
+        cls.expected = GoogleHtmlParser(cls.html_str).get_data()
+
+    def test_from_stream_bytes(self) -> None:
+        """Test streaming bytes.
+
+        Feed the HTML as bytes chunks, with the encoding detected from the HTML.
+        """
+        chunks = [self.html_bytes[i:i + 1024] for i in range(0, len(self.html_bytes), 1024)]
+        parser = GoogleHtmlParser.from_stream(chunks)
+        self.assertEqual(parser.get_data(), self.expected)
+
+    def test_from_stream_str(self) -> None:
+        """Test streaming strings.
+
+        Feed the HTML as string chunks.
+        """
+        chunks = [self.html_str[i:i + 1024] for i in range(0, len(self.html_str), 1024)]
+        parser = GoogleHtmlParser.from_stream(chunks)
+        self.assertEqual(parser.get_data(), self.expected)
+
+    def test_from_parsed_tree(self) -> None:
+        """Test reusing a parsed tree.
+
+        Ensure that a tree parsed with html.fromstring() can be shared by parsers.
+        """
+        tree = html.fromstring(self.html_str)
+        self.assertEqual(GoogleHtmlParser.from_parsed_tree(tree).get_data(), self.expected)
+        self.assertEqual(GoogleHtmlParser.from_parsed_tree(tree).get_data(), self.expected)
+
+    def test_set_tree(self) -> None:
+        """Test replacing the tree.
+
+        Ensure that the data is extracted from a tree assigned to the tree attribute.
+        """
+        parser = GoogleHtmlParser(_INVALID_HTML)
+        parser.tree = html.fromstring(self.html_str)
+        self.assertEqual(parser.get_data(), self.expected)
+
+    def test_from_cached(self) -> None:
+        """Test the parsed tree cache.
+
+        Ensure that parsers created for the same HTML share the tree and its data.
+        """
+        first = GoogleHtmlParser.from_cached(self.html_str)
+        second = GoogleHtmlParser.from_cached(self.html_str)
+        self.assertIs(first.tree, second.tree)
+        self.assertEqual(second.get_data(), self.expected)
+
+    def test_parse_many(self) -> None:
+        """Test parsing a batch of SERPs.
+
+        Ensure that every page of the batch gets the same data, in order, as parsing it
+        on its own.
+        """
+        results = parse_many([self.html_str, _INVALID_HTML, self.html_str], workers=1)
+        self.assertEqual(results, [self.expected, _INVALID_PARSER.get_data(), self.expected])
+
+    def test_get_data_as_tuples(self) -> None:
+        """Test final data without the dict conversion.
+
+        Ensure that the organic results are OrganicResult tuples holding the same data.
+        """
+        data = GoogleHtmlParser(self.html_str).get_data(as_dict=False)
+        organic = data.pop('organic_results')
+        for result in organic:
+            self.assertIsInstance(result, OrganicResult)
+        expected = dict(self.expected)
+        self.assertEqual([result._asdict() for result in organic],
+                         expected.pop('organic_results'))
+        self.assertEqual(data, expected)
+
+
+@unittest.skipIf(LexborHTMLParser is None, 'the lexbor backend requires selectolax')
+class TestGoogleHtmlParserLexbor(unittest.TestCase):
+    """Test Google HTML Parser with the lexbor backend."""
+
+    def test_get_data_matches_lxml(self) -> None:
+        """Test final data.
+
+        Ensure that the lexbor backend extracts the same data as the lxml backend.
+        """
+        html_str = FIXTURE.read_text(encoding='utf-8')
+        self.assertEqual(GoogleHtmlParser(html_str, backend='lexbor').get_data(),
+                         GoogleHtmlParser(html_str).get_data())
+
+
+class TestInvalidGoogleHtml(unittest.TestCase):
+    """Test Google HTML Parser with HTML that isn't a Google SERP."""
+
+    def test_invalid_google_html(self) -> None:
+        """Test invalid HTML.
+
+        Ensure that none of the search features are found, and that the parser returns
+        the empty values instead of raising an error.
+        """
+        self.assertEqual(_INVALID_PARSER.get_data(), {
+            'estimated_results': 0,
+            'featured_snippet': None,
+            'knowledge_card': None,
+            'organic_results': [],
+            'scrolling_widgets': [],
+        })
+
+
+@pytest.mark.live
+class TestGoogleHtmlParserLive(TestGoogleHtmlParser):
+    """Test Google HTML Parser against live Google Search.
+
+    Runs the same tests as TestGoogleHtmlParser on a SERP fetched from google.com, to
+    verify the parser still works with the current Google Search HTML. The fetch is
+    replayed from a vcrpy cassette once recorded, see the google_html fixture.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Setup test resources.
+
+        Nothing to do here, the parser is created from the google_html fixture.
+        """
+
+    def setUp(self) -> None:
+        """Skip the test if the live SERP wasn't provided.
+
+        Outside of pytest the google_html fixture doesn't run, and the inherited parser
+        of the stored fixture would make the live tests pass without testing anything.
+        """
+        if 'parser' not in vars(type(self)):
+            self.skipTest('the live SERP is provided by the google_html pytest fixture')
+
+    @pytest.fixture(autouse=True, scope='class')
+    @classmethod
+    def _parse_google_html(cls, google_html) -> None:
+        """Parse the live SERP shared through the google_html fixture."""
+        cls.parser = GoogleHtmlParser(html_str=google_html)
+
+        # Parse the organic results once for all tests that only read them
+        cls._organic = cls.parser._get_organic()
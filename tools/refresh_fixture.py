@@ -0,0 +1,30 @@
+"""Refresh the Google Search HTML fixture used by the tests.
+
+Fetches the desktop SERP for the test keyword from google.com and stores the raw
+HTML in test/fixtures, so the test suite can run without network access.
+
+Usage:
+    python tools/refresh_fixture.py
+"""
+import pathlib
+
+import requests
+
+FIXTURE = pathlib.Path(__file__).resolve().parent.parent / 'test' / 'fixtures' / 'google_data_science.html'
+KEYWORD = 'data science'
+HEADERS = {
+    'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36'
+}
+
+
+def main() -> None:
+    """Fetch the SERP and write it to the fixture file."""
+    res = requests.get('https://www.google.com/search', params={'q': KEYWORD, 'num': 100},
+                       headers=HEADERS)
+    res.raise_for_status()
+    FIXTURE.write_text(res.text, encoding='utf-8')
+    print(f'Wrote {len(res.text)} characters to {FIXTURE}')
+
+
+if __name__ == '__main__':
+    main()